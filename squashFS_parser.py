@@ -2,13 +2,16 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import collections
+import concurrent.futures
 import io
 import os
 import struct
 import sys
+import threading
 import zlib
 import lzma
-from math import ceil
+import mmap
 
 # Optional compressors
 _have_lz4 = False
@@ -30,9 +33,34 @@ try:
 except Exception:
     pass
 
+# Optional numpy for vectorized integer-array parsing (block_sizes, id table)
+_have_numpy = False
+try:
+    import numpy as np
+    _have_numpy = True
+except Exception:
+    pass
+
+# Optional accelerated inflate for gzip images (1.5~3x faster than stock zlib)
+_have_libdeflate = False
+_zlib_decompress = zlib.decompress
+try:
+    import deflate as libdeflate  # libdeflate bindings
+    _have_libdeflate = True
+except Exception:
+    try:
+        from zlib_ng import zlib_ng as _zlib_ng  # drop-in zlib API
+        _zlib_decompress = _zlib_ng.decompress
+    except Exception:
+        pass
+
 # ---- Constants ----
 MAGIC = 0x73717368
 
+# 메타데이터 읽기용 슬랩(윈도우) 크기: 256 KiB
+SLAB_SHIFT = 18
+SLAB_SIZE = 1 << SLAB_SHIFT
+
 COMPRESSOR_GZIP = 1
 COMPRESSOR_LZMA = 2
 COMPRESSOR_LZO  = 3
@@ -40,9 +68,36 @@ COMPRESSOR_XZ   = 4
 COMPRESSOR_LZ4  = 5
 COMPRESSOR_ZSTD = 6
 
-def u16(b, o): return struct.unpack_from("<H", b, o)[0]
-def u32(b, o): return struct.unpack_from("<I", b, o)[0]
-def u64(b, o): return struct.unpack_from("<Q", b, o)[0]
+# 컴파일된 Struct: 호출마다 포맷 문자열을 재해석하지 않음
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_U64 = struct.Struct("<Q")
+
+def u16(b, o): return _U16.unpack_from(b, o)[0]
+def u32(b, o): return _U32.unpack_from(b, o)[0]
+def u64(b, o): return _U64.unpack_from(b, o)[0]
+
+# 인코드 타입별 고정 레이아웃 파서
+_INODE_HDR   = struct.Struct("<HHHHII")    # type, mode, uid_idx, gid_idx, mtime, ino
+_FILE_BASIC  = struct.Struct("<IIII")      # blocks_start, frag_idx, frag_off, file_size
+_FILE_EXT    = struct.Struct("<QQQIIII")   # blocks_start, file_size, sparse, nlink, frag_idx, frag_off, xattr_idx
+_DIR_BASIC   = struct.Struct("<IIHHI")     # start_block, nlink, file_size, offset, parent
+_DIR_EXT     = struct.Struct("<IIIIHHI")   # nlink, file_size, start_block, parent, i_count, offset, xattr_idx
+_SYMLINK_HDR = struct.Struct("<II")        # nlink, target_size
+_FRAG_ENT    = struct.Struct("<QII")       # start, size(+flags), unused
+_XATTR_ID    = struct.Struct("<QII")       # ref, count, size
+_XATTR_KV    = struct.Struct("<HH")        # type, name_size
+
+def u32_array(b, o, count):
+    # count개의 u32를 한 번의 C 루프로 파싱 (요소별 unpack_from 호출 제거)
+    if _have_numpy:
+        return np.frombuffer(b, dtype="<u4", count=count, offset=o)
+    return struct.unpack_from(f"<{count}I", b, o)
+
+def u64_array(b, o, count):
+    if _have_numpy:
+        return np.frombuffer(b, dtype="<u8", count=count, offset=o)
+    return struct.unpack_from(f"<{count}Q", b, o)
 
 def human(n):
     for unit in ["B","KiB","MiB","GiB","TiB"]:
@@ -50,14 +105,56 @@ def human(n):
             return f"{n:.1f} {unit}"
         n /= 1024.0
 
+# 디렉터리 테이블 파싱용 컴파일된 struct (hot loop에서 포맷 재해석 방지)
+_DIR_HDR = struct.Struct("<III")   # count-1, inode block rel start, inode base
+_DIR_ENT = struct.Struct("<HhHH")  # offset, ino delta, type, name_size-1
+
+# 디렉터리 엔트리는 엔트리별 dict 대신 평행 리스트(SoA)로 보관
+DirEntries = collections.namedtuple("DirEntries", ["names", "refs", "inos", "types"])
+
+def _parse_dir_buf(buf):
+    # 디렉터리 리스팅 버퍼 → 평행 리스트. 엔트리당 작업을 최소화한 타이트 루프
+    names, refs, inos, types = [], [], [], []
+    add_name = names.append
+    add_ref = refs.append
+    add_ino = inos.append
+    add_type = types.append
+    hdr_unpack = _DIR_HDR.unpack_from
+    ent_unpack = _DIR_ENT.unpack_from
+    cur = 0
+    end = len(buf)
+    while cur + 12 <= end:
+        count, inode_table_rel_start, ref_ino_base = hdr_unpack(buf, cur)
+        cur += 12
+        ref_base = (inode_table_rel_start & 0xFFFFFFFF) << 16
+        for _ in range(count + 1):
+            if cur + 8 > end:
+                return DirEntries(names, refs, inos, types)
+            off, ino_delta, ent_type, name_size_m1 = ent_unpack(buf, cur)
+            cur += 8
+            name_end = cur + name_size_m1 + 1
+            if name_end > end:
+                return DirEntries(names, refs, inos, types)
+            add_name(buf[cur:name_end].decode('utf-8', errors='surrogateescape'))
+            add_ref(ref_base | off)
+            add_ino(ref_ino_base + ino_delta)
+            add_type(ent_type)
+            cur = name_end
+    return DirEntries(names, refs, inos, types)
+
 def _safe_join(base, name):
     # 경로 탈출 방지: 이름 내 슬래시 제거/정규화
     name = name.replace("\\", "/").split("/")[-1]
     return os.path.join(base, name)
 
 class Decompressor:
-    def __init__(self, comp_id):
+    # LZMA1 raw fallback용 필터 체인 (호출마다 dict를 새로 만들지 않도록 고정)
+    _LZMA1_RAW_FILTERS = [{"id": lzma.FILTER_LZMA1, "dict_size": 1 << 23}]
+
+    def __init__(self, comp_id, max_block=131072):
         self.comp_id = comp_id
+        # libdeflate는 출력 상한을 요구함: 데이터 블록 크기와 메타블록(8KiB) 중 큰 쪽
+        self._max_out = max(8192, max_block)
         if comp_id not in (COMPRESSOR_GZIP, COMPRESSOR_XZ, COMPRESSOR_LZMA,
                            COMPRESSOR_LZO, COMPRESSOR_LZ4, COMPRESSOR_ZSTD):
             raise ValueError(f"Unknown compressor id {comp_id}")
@@ -69,37 +166,109 @@ class Decompressor:
         if comp_id == COMPRESSOR_LZO and not _have_lzo:
             raise RuntimeError("LZO image but 'python-lzo' not installed. `pip install python-lzo`")
 
+        # zstd 컨텍스트는 호출마다 만들지 않고 재사용. 단, ZstdDecompressor는
+        # 스레드 안전이 아니므로 decompress 풀을 위해 thread-local로 보관
+        self._tls = threading.local()
+
+    def _zstd_dctx(self):
+        dctx = getattr(self._tls, "zstd_dctx", None)
+        if dctx is None:
+            dctx = zstd.ZstdDecompressor()
+            self._tls.zstd_dctx = dctx
+        return dctx
+
     def _decomp(self, data):
         if self.comp_id == COMPRESSOR_GZIP:
-            return zlib.decompress(data)
+            if _have_libdeflate:
+                return libdeflate.zlib_decompress(data, self._max_out)
+            return _zlib_decompress(data)
         elif self.comp_id == COMPRESSOR_XZ:
             return lzma.decompress(data, format=lzma.FORMAT_XZ)
         elif self.comp_id == COMPRESSOR_LZMA:
             try:
                 return lzma.decompress(data)  # auto-detect
             except lzma.LZMAError:
-                filt = {"id": lzma.FILTER_LZMA1, "dict_size": 1 << 23}
-                return lzma.decompress(data, format=lzma.FORMAT_RAW, filters=[filt])
+                return lzma.decompress(data, format=lzma.FORMAT_RAW,
+                                       filters=self._LZMA1_RAW_FILTERS)
         elif self.comp_id == COMPRESSOR_LZ4:
             return lz4f.decompress(data)
         elif self.comp_id == COMPRESSOR_ZSTD:
-            dctx = zstd.ZstdDecompressor()
-            return dctx.decompress(data)
+            return self._zstd_dctx().decompress(data)
         elif self.comp_id == COMPRESSOR_LZO:
             return pylzo.decompress(data)
 
     def decompress_meta(self, data, uncompressed_flag):
         return data if uncompressed_flag else self._decomp(data)
 
+    def decompress_meta_bounded(self, data, uncompressed_flag, max_out):
+        # 앞쪽 max_out 바이트만 필요할 때: 스트리밍 API로 일찍 중단해
+        # 8KiB 블록 전체를 해제하는 비용을 피한다
+        if uncompressed_flag:
+            return data[:max_out]
+        if self.comp_id == COMPRESSOR_GZIP:
+            return zlib.decompressobj().decompress(data, max_out)
+        if self.comp_id == COMPRESSOR_XZ:
+            return lzma.LZMADecompressor(format=lzma.FORMAT_XZ).decompress(data, max_length=max_out)
+        if self.comp_id == COMPRESSOR_LZMA:
+            try:
+                return lzma.LZMADecompressor().decompress(data, max_length=max_out)
+            except lzma.LZMAError:
+                dec = lzma.LZMADecompressor(format=lzma.FORMAT_RAW,
+                                            filters=self._LZMA1_RAW_FILTERS)
+                return dec.decompress(data, max_length=max_out)
+        if self.comp_id == COMPRESSOR_LZ4:
+            return lz4f.LZ4FrameDecompressor().decompress(data, max_length=max_out)
+        if self.comp_id == COMPRESSOR_ZSTD:
+            return self._zstd_dctx().stream_reader(io.BytesIO(data)).read(max_out)
+        # LZO: 스트리밍 API 없음 → 전체 해제 후 절단
+        return self._decomp(data)[:max_out]
+
     def decompress_data(self, data, is_uncompressed):
         return data if is_uncompressed else self._decomp(data)
 
 class SquashFS:
-    def __init__(self, f):
+    def __init__(self, f, meta_cache_blocks=256):
         self.f = f
+        try:
+            self._fd = f.fileno()   # os.pread로 파일 객체 잠금/상태 우회
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            self._fd = None
+        if self._fd is not None and hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(self._fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        # 이미지 전체를 mmap → 블록 접근이 syscall 없는 슬라이스가 됨
+        self._mm = None
+        if self._fd is not None:
+            try:
+                self._mm = mmap.mmap(self._fd, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                self._mm = None
+        self._mmv = memoryview(self._mm) if self._mm is not None else None
+        self._slab_cache = {}      # slab index -> 256 KiB raw window
+        # 데이터 블록 읽기를 배치로 제출해 큐 깊이를 채우는 I/O 풀
+        self._io_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1))
+        # 블록 해제(decompress)용 풀: C 구현 코덱들은 GIL을 놓으므로 병렬화 가능
+        self._decomp_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1)
         self._read_super()
-        self.decomp = Decompressor(self.compression_id)
-        self._meta_cache = {}      # abs_off -> decompressed 8KiB (or smaller) block
+        if self._mm is not None and hasattr(self._mm, "madvise"):
+            # 데이터 영역은 순차, 메타데이터 테이블 영역은 랜덤 접근 힌트
+            try:
+                split = (self.inode_table_start // mmap.PAGESIZE) * mmap.PAGESIZE
+                if split > 0:
+                    self._mm.madvise(mmap.MADV_SEQUENTIAL, 0, split)
+                self._mm.madvise(mmap.MADV_RANDOM, split)
+            except (ValueError, OSError):
+                pass
+        self.decomp = Decompressor(self.compression_id, max_block=self.block_size)
+        self._build_file_parsers()
+        # abs_off -> decompressed 8KiB (or smaller) block, LRU 한도로 메모리 상한 고정
+        self._meta_cache = collections.OrderedDict()
+        self._meta_cache_cap = max(1, meta_cache_blocks)
+        self._meta_index = {}      # table_start_abs -> [abs offset of block 0, 1, ...]
         self._id_list = None       # list of u32, length = id_count
         self._fragments = None     # list of (start, size_on_disk, uncompressed_flag)
         self._xattr_lookup = None  # list of dict entries for xattr lookup table
@@ -108,6 +277,9 @@ class SquashFS:
         # 권한/속성 적용 토글 (main에서 --no-meta로 끌 수 있음)
         self.apply_meta = True
 
+        # 병렬 추출 시 트리 순회가 모아두는 파일 레코드 (serial이면 None)
+        self._file_records = None
+
         # 통계 수집
         self.stats = {
             "dirs": 0,
@@ -148,48 +320,220 @@ class SquashFS:
         self.export_table_start = u64(sb, 88)
         if self.version_major != 4:
             raise ValueError(f"Unsupported SquashFS version {self.version_major}.{self.version_minor}")
+        # 2의 거듭제곱 블록이면 % 대신 마스크 연산용
+        self._bs_mask = (self.block_size - 1) if (
+            self.block_size and (1 << self.block_log) == self.block_size) else None
+
+    def _build_file_parsers(self):
+        # 파일 inode 디코드는 파일마다 같은 분기/상수를 재평가한다.
+        # 이미지 고정 상수(block_size/log)를 리터럴로 접어 넣은 타입별 파서를
+        # 열 때 한 번 생성해 두고 타입으로 디스패치한다.
+        bs = self.block_size
+        if bs and (1 << self.block_log) == bs:
+            full_expr = f"file_size >> {self.block_log}"
+            ceil_expr = f"(file_size + {bs - 1}) >> {self.block_log}"
+            tail_expr = f"(file_size & {bs - 1}) != 0"
+        else:  # block_log가 block_size와 안 맞는 비정상 이미지: 나눗셈 유지
+            full_expr = f"file_size // {bs}"
+            ceil_expr = f"-(-file_size // {bs})"
+            tail_expr = f"(file_size % {bs}) != 0"
+
+        src_basic = (
+            "def _parse_basic(block, cur):\n"
+            "    blocks_start, frag_idx, frag_off, file_size = _FILE_BASIC.unpack_from(block, cur)\n"
+            "    cur += 16\n"
+            f"    if {tail_expr} and frag_idx != 0xFFFFFFFF:\n"
+            f"        count = {full_expr}\n"
+            "    else:\n"
+            f"        count = {ceil_expr}\n"
+            "    return blocks_start, frag_idx, frag_off, file_size, None, "
+            "u32_array(block, cur, count)\n")
+        src_ext = (
+            "def _parse_ext(block, cur):\n"
+            "    (blocks_start, file_size, _sparse, _nlink,\n"
+            "     frag_idx, frag_off, xattr_idx) = _FILE_EXT.unpack_from(block, cur)\n"
+            "    cur += 40\n"
+            "    if frag_idx != 0xFFFFFFFF:\n"
+            f"        count = {full_expr}\n"
+            "    else:\n"
+            f"        count = {ceil_expr}\n"
+            "    return blocks_start, frag_idx, frag_off, file_size, xattr_idx, "
+            "u32_array(block, cur, count)\n")
+
+        env = {"_FILE_BASIC": _FILE_BASIC, "_FILE_EXT": _FILE_EXT, "u32_array": u32_array}
+        ns = {}
+        exec(compile(src_basic, "<file-basic-parser>", "exec"), env, ns)
+        exec(compile(src_ext, "<file-ext-parser>", "exec"), env, ns)
+        self._parse_file_basic = ns["_parse_basic"]
+        self._parse_file_ext = ns["_parse_ext"]
+
+    def _has_tail(self, file_size):
+        if self._bs_mask is not None:
+            return (file_size & self._bs_mask) != 0
+        return (file_size % self.block_size) != 0
 
     # ---------- Metadata helpers ----------
+    def _pread(self, offset, size):
+        if self._mm is not None:
+            return self._mm[offset:offset + size]
+        if self._fd is not None:
+            return os.pread(self._fd, size, offset)
+        self.f.seek(offset)
+        return self.f.read(size)
+
+    def _read_at(self, offset, size):
+        if self._mm is not None:
+            # mmap이면 슬랩 캐시가 불필요: 슬라이스 한 번이면 끝
+            return self._mm[offset:offset + size]
+        # 256 KiB 슬랩 단위로 캐시해서 블록당 seek+read syscall 쌍 제거
+        out = b""
+        while size > 0:
+            slab_idx = offset >> SLAB_SHIFT
+            slab = self._slab_cache.get(slab_idx)
+            if slab is None:
+                slab = self._pread(slab_idx << SLAB_SHIFT, SLAB_SIZE)
+                self._slab_cache[slab_idx] = slab
+            in_off = offset & (SLAB_SIZE - 1)
+            chunk = slab[in_off:in_off + size]
+            if not chunk:
+                break
+            out = chunk if not out else out + chunk
+            offset += len(chunk)
+            size -= len(chunk)
+        return out
+
     def _read_meta_block(self, abs_off):
         if abs_off in self._meta_cache:
+            self._meta_cache.move_to_end(abs_off)
             return self._meta_cache[abs_off]
-        self.f.seek(abs_off)
-        hdr2 = self.f.read(2)
+        mmv = self._mmv
+        if mmv is not None:
+            if abs_off + 2 > len(mmv):
+                raise EOFError("EOF in metadata header")
+            size = _U16.unpack_from(mmv, abs_off)[0]
+            uncompressed = (size & 0x8000) != 0
+            size &= 0x7FFF
+            if abs_off + 2 + size > len(mmv):
+                raise EOFError("EOF in metadata payload")
+            if uncompressed:
+                # 비압축 블록은 mmap 위의 memoryview 그대로 반환 (복사 0회)
+                data = mmv[abs_off + 2:abs_off + 2 + size]
+            else:
+                data = self.decomp.decompress_meta(
+                    bytes(mmv[abs_off + 2:abs_off + 2 + size]), False)
+            self._meta_cache[abs_off] = data
+            if len(self._meta_cache) > self._meta_cache_cap:
+                self._meta_cache.popitem(last=False)
+            return data
+        hdr2 = self._read_at(abs_off, 2)
         if len(hdr2) != 2:
             raise EOFError("EOF in metadata header")
-        size = struct.unpack("<H", hdr2)[0]
+        size = _U16.unpack(hdr2)[0]
         uncompressed = (size & 0x8000) != 0
         size &= 0x7FFF
-        raw = self.f.read(size)
+        raw = self._read_at(abs_off + 2, size)
         if len(raw) != size:
             raise EOFError("EOF in metadata payload")
         data = self.decomp.decompress_meta(raw, uncompressed)
         self._meta_cache[abs_off] = data
+        if len(self._meta_cache) > self._meta_cache_cap:
+            self._meta_cache.popitem(last=False)
         return data
 
+    def _read_meta_blocks(self, ptrs):
+        # 테이블 로드용: 인접한 메타블록들을 한 번의 벌크 읽기로 가져와
+        # 블록별 해제를 풀에서 병렬 수행 (N번의 작은 읽기 → 1번의 큰 읽기)
+        ptrs = [int(p) for p in ptrs]
+        out = {}
+        missing = []
+        for p in ptrs:
+            if p in self._meta_cache:
+                self._meta_cache.move_to_end(p)
+                out[p] = self._meta_cache[p]
+            else:
+                missing.append(p)
+        if missing:
+            lo = min(missing)
+            hi = max(missing)
+            # 마지막 블록의 헤더(2B) + payload 최대치(0x7FFF)까지 커버
+            raw = self._pread(lo, (hi - lo) + 2 + 0x7FFF)
+            jobs = []  # (abs ptr, payload, uncompressed)
+            for p in missing:
+                off = p - lo
+                if off + 2 > len(raw):
+                    raise EOFError("EOF in metadata header")
+                size = _U16.unpack_from(raw, off)[0]
+                uncompressed = (size & 0x8000) != 0
+                size &= 0x7FFF
+                payload = raw[off + 2:off + 2 + size]
+                if len(payload) != size:
+                    raise EOFError("EOF in metadata payload")
+                jobs.append((p, bytes(payload), uncompressed))
+            comp = [(p, d) for p, d, unc in jobs if not unc]
+            if len(comp) > 1:
+                decoded = dict(zip((p for p, _ in comp),
+                                   self._decomp_pool.map(self.decomp._decomp,
+                                                         [d for _, d in comp])))
+            else:
+                decoded = {p: self.decomp._decomp(d) for p, d in comp}
+            for p, d, unc in jobs:
+                data = d if unc else decoded[p]
+                out[p] = data
+                self._meta_cache[p] = data
+                if len(self._meta_cache) > self._meta_cache_cap:
+                    self._meta_cache.popitem(last=False)
+        return [out[p] for p in ptrs]
+
+    def _read_meta_block_bounded(self, abs_off, max_out):
+        # 캐시에 있으면 그대로 쓰고, 없으면 필요한 접두부만 해제 (캐시에 넣지 않음:
+        # 부분 블록을 캐시하면 이후 전체 읽기가 잘린 데이터를 보게 됨)
+        cached = self._meta_cache.get(abs_off)
+        if cached is not None:
+            self._meta_cache.move_to_end(abs_off)
+            return cached
+        hdr2 = self._read_at(abs_off, 2)
+        if len(hdr2) != 2:
+            raise EOFError("EOF in metadata header")
+        size = _U16.unpack(hdr2)[0]
+        uncompressed = (size & 0x8000) != 0
+        size &= 0x7FFF
+        raw = self._read_at(abs_off + 2, size)
+        if len(raw) != size:
+            raise EOFError("EOF in metadata payload")
+        return self.decomp.decompress_meta_bounded(raw, uncompressed, max_out)
+
     def _skip_n_meta_blocks(self, table_start_abs, n):
-        abs_ptr = table_start_abs
-        for _ in range(n):
-            self.f.seek(abs_ptr)
-            hdr2 = self.f.read(2)
+        # 테이블별 블록 오프셋 인덱스를 lazy하게 확장 → 재방문 시 O(1) 조회
+        idx = self._meta_index.setdefault(table_start_abs, [table_start_abs])
+        while len(idx) <= n:
+            hdr2 = self._read_at(idx[-1], 2)
             if len(hdr2) != 2:
                 raise EOFError("EOF while skipping metadata blocks")
-            size = struct.unpack("<H", hdr2)[0] & 0x7FFF
-            abs_ptr += 2 + size
-        return abs_ptr
+            size = _U16.unpack(hdr2)[0] & 0x7FFF
+            idx.append(idx[-1] + 2 + size)
+        return idx[n]
 
-    def _read_from_meta_stream(self, table_start_abs, rel_off, need_len):
+    def _read_from_meta_stream(self, table_start_abs, rel_off, need_len, bounded=False):
         out = bytearray()
+        # 블록 인덱스를 지역적으로 전진: 매 반복 rel_off로부터의 재계산 제거
+        block_index = rel_off // 8192
+        in_block_off = rel_off % 8192
         while len(out) < need_len:
-            block_index = rel_off // 8192
-            in_block_off = rel_off % 8192
             abs_ptr = self._skip_n_meta_blocks(table_start_abs, block_index)
-            block = self._read_meta_block(abs_ptr)
+            if bounded:
+                # 일회성 소량 읽기(xattr 값 참조 등): 필요한 접두부만 해제
+                block = self._read_meta_block_bounded(
+                    abs_ptr, in_block_off + (need_len - len(out)))
+            else:
+                block = self._read_meta_block(abs_ptr)
             take = min(need_len - len(out), len(block) - in_block_off)
             if take <= 0:
                 break
             out += block[in_block_off:in_block_off + take]
-            rel_off += take
+            if in_block_off + take < 8192 and in_block_off + take >= len(block):
+                break  # 8KiB 미만(마지막) 블록을 끝까지 소비 → 스트림 소진
+            block_index += 1
+            in_block_off = 0
         return bytes(out)
 
     def _read_meta_span(self, first_abs_ptr, start_in_first, need_len):
@@ -203,13 +547,12 @@ class SquashFS:
             out += block[start_in_first:start_in_first + take]
             remaining -= take
 
-        self.f.seek(abs_ptr)
-        hdr = self.f.read(2)
+        hdr = self._read_at(abs_ptr, 2)
         if len(hdr) != 2:
             if remaining > 0:
                 raise EOFError("EOF while advancing metadata (first block)")
             return bytes(out)
-        size_on_disk = struct.unpack("<H", hdr)[0] & 0x7FFF
+        size_on_disk = _U16.unpack(hdr)[0] & 0x7FFF
         abs_ptr += 2 + size_on_disk
 
         while remaining > 0:
@@ -220,11 +563,10 @@ class SquashFS:
             out += block[:take]
             remaining -= take
 
-            self.f.seek(abs_ptr)
-            hdr = self.f.read(2)
+            hdr = self._read_at(abs_ptr, 2)
             if len(hdr) != 2:
                 break
-            size_on_disk = struct.unpack("<H", hdr)[0] & 0x7FFF
+            size_on_disk = _U16.unpack(hdr)[0] & 0x7FFF
             abs_ptr += 2 + size_on_disk
 
         return bytes(out)
@@ -236,16 +578,13 @@ class SquashFS:
         if self.id_count == 0 or self.id_table_start == 0xFFFFFFFFFFFFFFFF:
             self._id_list = []
             return
-        num_md = int(ceil(self.id_count / 2048.0))
-        self.f.seek(self.id_table_start)
-        ptrs = [u64(self.f.read(8), 0) for _ in range(num_md)]
+        num_md = -(-self.id_count // 2048)
+        ptrs = u64_array(self._pread(self.id_table_start, 8 * num_md), 0, num_md)
         out = []
-        for p in ptrs:
-            block = self._read_meta_block(p)
-            off = 0
-            while off + 4 <= len(block) and len(out) < self.id_count:
-                out.append(u32(block, off))
-                off += 4
+        for block in self._read_meta_blocks(ptrs):
+            n = min(len(block) // 4, self.id_count - len(out))
+            vals = u32_array(block, 0, n)
+            out.extend(vals.tolist() if _have_numpy else vals)
         self._id_list = out  # index -> uid/gid value
 
     # ---------- Xattr tables ----------
@@ -257,21 +596,18 @@ class SquashFS:
             self._xattr_stream_base = None
             return
 
-        self.f.seek(self.xattr_id_table_start)
-        xattr_table_start = u64(self.f.read(8), 0)
-        xattr_ids = u32(self.f.read(4), 0)
-        _ = self.f.read(4)  # unused
-        num_md = int(ceil(xattr_ids / 512.0))
-        md_ptrs = [u64(self.f.read(8), 0) for _ in range(num_md)]
+        hdr = self._pread(self.xattr_id_table_start, 16)
+        xattr_table_start = u64(hdr, 0)
+        xattr_ids = u32(hdr, 8)  # 마지막 4바이트는 unused
+        num_md = -(-xattr_ids // 512)
+        md_ptrs = u64_array(self._pread(self.xattr_id_table_start + 16, 8 * num_md),
+                            0, num_md)
 
         entries = []
-        for p in md_ptrs:
-            block = self._read_meta_block(p)
+        for block in self._read_meta_blocks(md_ptrs):
             off = 0
             while off + 16 <= len(block) and len(entries) < xattr_ids:
-                xref = u64(block, off + 0)
-                cnt  = u32(block, off + 8)
-                size = u32(block, off + 12)
+                xref, cnt, size = _XATTR_ID.unpack_from(block, off)
                 entries.append({"ref": xref, "count": cnt, "size": size})
                 off += 16
 
@@ -305,8 +641,7 @@ class SquashFS:
         for _ in range(kv_count):
             if cur + 4 > len(blob):
                 break
-            typ = u16(blob, cur + 0)
-            name_size = u16(blob, cur + 2)
+            typ, name_size = _XATTR_KV.unpack_from(blob, cur)
             cur += 4
             if cur + name_size > len(blob):
                 break
@@ -331,9 +666,9 @@ class SquashFS:
                 vref = u64(blob, cur); cur += 8
                 v_md0_abs = (vref >> 16) & 0xFFFFFFFF
                 v_off = vref & 0xFFFF
-                raw4 = self._read_from_meta_stream(v_md0_abs, v_off, 4)
+                raw4 = self._read_from_meta_stream(v_md0_abs, v_off, 4, bounded=True)
                 val_len = u32(raw4, 0)
-                value = self._read_from_meta_stream(v_md0_abs, v_off + 4, val_len)
+                value = self._read_from_meta_stream(v_md0_abs, v_off + 4, val_len, bounded=True)
 
             key = f"{prefix}.{name_raw.decode('utf-8', errors='surrogateescape')}"
             out.append((key, value))
@@ -354,12 +689,8 @@ class SquashFS:
             if len(safe_buf) < 16:
                 raise EOFError("inode header truncated across metadata blocks")
 
-        inode_type   = u16(safe_buf, 0)
-        permissions  = u16(safe_buf, 2)
-        uid_idx      = u16(safe_buf, 4)
-        gid_idx      = u16(safe_buf, 6)
-        mtime        = u32(safe_buf, 8)
-        ino          = u32(safe_buf, 12)
+        (inode_type, permissions, uid_idx, gid_idx,
+         mtime, ino) = _INODE_HDR.unpack_from(safe_buf, 0)
         hdr = {
             "type": inode_type, "mode": permissions,
             "uid_idx": uid_idx, "gid_idx": gid_idx,
@@ -379,11 +710,10 @@ class SquashFS:
             buf += first_block[block_offset:block_offset + take]
         remaining -= take
 
-        self.f.seek(abs_ptr)
-        hdr = self.f.read(2)
+        hdr = self._read_at(abs_ptr, 2)
         if len(hdr) != 2:
             raise EOFError("EOF while advancing directory metadata")
-        size_on_disk = struct.unpack("<H", hdr)[0] & 0x7FFF
+        size_on_disk = _U16.unpack(hdr)[0] & 0x7FFF
         abs_ptr += 2 + size_on_disk
 
         while remaining > 0:
@@ -394,47 +724,13 @@ class SquashFS:
             buf += block[:take]
             remaining -= take
 
-            self.f.seek(abs_ptr)
-            hdr = self.f.read(2)
+            hdr = self._read_at(abs_ptr, 2)
             if len(hdr) != 2:
                 break
-            size_on_disk = struct.unpack("<H", hdr)[0] & 0x7FFF
+            size_on_disk = _U16.unpack(hdr)[0] & 0x7FFF
             abs_ptr += 2 + size_on_disk
 
-        entries = []
-        cur = 0
-        end = len(buf)
-
-        while cur + 12 <= end:
-            count = u32(buf, cur + 0)
-            inode_table_rel_start = u32(buf, cur + 4)
-            ref_ino_base = u32(buf, cur + 8)
-            cur += 12
-
-            for _ in range(count + 1):
-                if cur + 8 > end:
-                    return entries
-                off = u16(buf, cur + 0)                       # inode 메타블록 내 오프셋 (decompressed)
-                ino_delta = struct.unpack_from("<h", buf, cur + 2)[0]
-                ent_type = u16(buf, cur + 4)
-                name_size_m1 = u16(buf, cur + 6)
-                cur += 8
-
-                name_len = name_size_m1 + 1
-                if cur + name_len > end:
-                    return entries
-                name = buf[cur:cur + name_len].decode('utf-8', errors='surrogateescape')
-                cur += name_len
-
-                ref = ((inode_table_rel_start & 0xFFFFFFFF) << 16) | (off & 0xFFFF)
-                entries.append({
-                    "name": name,
-                    "inode_ref": ref,
-                    "inode_no": (ref_ino_base + ino_delta),
-                    "type": ent_type
-                })
-
-        return entries
+        return _parse_dir_buf(buf)
 
     def _load_fragments(self):
         if self._fragments is not None:
@@ -443,57 +739,121 @@ class SquashFS:
         if c == 0 or self.fragment_table_start == 0xFFFFFFFFFFFFFFFF:
             self._fragments = []
             return
-        self.f.seek(self.fragment_table_start)
-        num_md = int(ceil(c / 512.0))
-        md_ptrs = [u64(self.f.read(8), 0) for _ in range(num_md)]
+        num_md = -(-c // 512)
+        md_ptrs = u64_array(self._pread(self.fragment_table_start, 8 * num_md),
+                            0, num_md)
         frags = []
-        for p in md_ptrs:
-            block = self._read_meta_block(p)
+        for block in self._read_meta_blocks(md_ptrs):
             off = 0
             while off + 16 <= len(block) and len(frags) < c:
-                start = u64(block, off)
-                size_raw = u32(block, off + 8)
+                start, size_raw, _unused = _FRAG_ENT.unpack_from(block, off)
                 uncompressed = (size_raw & 0x01000000) != 0
                 size_on_disk = size_raw & 0x00FFFFFF
                 frags.append((start, size_on_disk, uncompressed))
                 off += 16
         self._fragments = frags
 
-    def _read_file_data(self, blocks_start, file_size, block_sizes, fragment_block_index, frag_offset):
-        out = io.BytesIO()
+    def _read_file_data(self, blocks_start, file_size, block_sizes, fragment_block_index, frag_offset,
+                        out_fd=None):
+        # 블록(+fragment) 읽기를 한 배치로 제출하고, 완료분을 순서대로 해제
+        plan = []   # 블록별 (reads 인덱스 또는 None(sparse), is_uncompressed)
+        reads = []  # (절대 오프셋, on-disk 크기)
         cur = blocks_start
-        remaining = file_size
+        planned = file_size
         for raw in block_sizes:
-            if remaining <= 0:
+            if planned <= 0:
                 break
+            # numpy 배열에서 온 u32 스칼라는 오프셋 연산이 4GiB에서 wrap되므로
+            # 네이티브 int로 강제 (cur/on_disk는 그대로 pread 오프셋이 됨)
+            raw = int(raw)
             is_uncompressed = (raw & 0x01000000) != 0
             on_disk = raw & 0x00FFFFFF
             if on_disk == 0:
-                # sparse block
+                plan.append((None, False))  # sparse block
+            else:
+                plan.append((len(reads), is_uncompressed))
+                reads.append((cur, on_disk))
+                cur += on_disk
+            planned -= min(self.block_size, planned)
+
+        frag_read_idx = None
+        frag_is_uncomp = False
+        if planned > 0 and fragment_block_index != 0xFFFFFFFF:
+            self._load_fragments()
+            start, on_disk, frag_is_uncomp = self._fragments[fragment_block_index]
+            frag_read_idx = len(reads)
+            reads.append((start, on_disk))
+
+        if self._mm is not None:
+            mm = self._mm
+            chunks = [mm[off:off + size] for off, size in reads]
+        elif self._fd is not None and len(reads) > 1:
+            fd = self._fd
+            chunks = list(self._io_pool.map(lambda r: os.pread(fd, r[1], r[0]), reads))
+        else:
+            chunks = [self._pread(off, size) for off, size in reads]
+
+        # 압축 해제를 스레드 풀로 병렬화 (map이 블록 순서를 보존)
+        if sum(1 for ri, unc in plan if ri is not None and not unc) > 1:
+            datas = list(self._decomp_pool.map(
+                lambda p: None if p[0] is None else
+                self.decomp.decompress_data(chunks[p[0]], p[1]), plan))
+        else:
+            datas = [None if ri is None else
+                     self.decomp.decompress_data(chunks[ri], unc) for ri, unc in plan]
+
+        if out_fd is not None:
+            # 전체 파일을 메모리에 쌓지 않고 블록을 곧바로 fd에 기록
+            # (sparse 블록은 lseek으로 구멍을 남김)
+            remaining = file_size
+            for data in datas:
+                if remaining <= 0:
+                    break
+                if data is None:  # sparse block
+                    to_write = min(self.block_size, remaining)
+                    os.lseek(out_fd, to_write, os.SEEK_CUR)
+                    remaining -= to_write
+                    continue
+                take = min(len(data), remaining)
+                os.write(out_fd, data[:take] if take != len(data) else data)
+                remaining -= take
+            if remaining > 0 and frag_read_idx is not None:
+                frag_data = self.decomp.decompress_data(chunks[frag_read_idx], frag_is_uncomp)
+                os.write(out_fd, frag_data[frag_offset:frag_offset+remaining])
+                remaining = 0
+            os.ftruncate(out_fd, file_size)
+            return file_size
+
+        # 출력은 미리 file_size만큼 할당하고 memoryview 슬라이스로 blit
+        # (BytesIO의 블록별 write + 최종 getvalue() 복사 제거)
+        out = bytearray(file_size)
+        mv = memoryview(out)
+        pos = 0
+        remaining = file_size
+        for data in datas:
+            if remaining <= 0:
+                break
+            if data is None:  # sparse block: bytearray는 0으로 초기화되어 있음
                 to_write = min(self.block_size, remaining)
-                out.write(b"\x00" * to_write)
+                pos += to_write
                 remaining -= to_write
                 continue
-            self.f.seek(cur)
-            chunk = self.f.read(on_disk)
-            cur += on_disk
-            data = self.decomp.decompress_data(chunk, is_uncompressed)
             take = min(len(data), remaining)
-            out.write(data[:take])
+            mv[pos:pos+take] = data[:take]
+            pos += take
             remaining -= take
 
-        if remaining > 0 and fragment_block_index != 0xFFFFFFFF:
-            self._load_fragments()
-            start, on_disk, is_uncomp = self._fragments[fragment_block_index]
-            self.f.seek(start)
-            frag_raw = self.f.read(on_disk)
-            frag_data = self.decomp.decompress_data(frag_raw, is_uncomp)
-            out.write(frag_data[frag_offset:frag_offset+remaining])
+        if remaining > 0 and frag_read_idx is not None:
+            frag_data = self.decomp.decompress_data(chunks[frag_read_idx], frag_is_uncomp)
+            tail = frag_data[frag_offset:frag_offset+remaining]
+            mv[pos:pos+len(tail)] = tail
             remaining = 0
-        return out.getvalue()
+        return out
 
     # ---------- Extraction ----------
     def _apply_mode_uidgid_xattr(self, path, mode_bits, uid_idx, gid_idx, xattrs_idx):
+        # path는 경로 문자열 또는 열린 fd. chmod/chown/setxattr 모두 fd를 받으므로
+        # 파일 추출 경로는 fd를 넘겨 경로 재탐색(lookup) 비용을 없앤다
         if not getattr(self, "apply_meta", True):
             return
         # mode
@@ -521,92 +881,120 @@ class SquashFS:
         except Exception:
             pass
 
-    def extract_all(self, outdir):
+    def _write_file(self, path, blocks_start, file_size, block_sizes, frag_idx, frag_off,
+                    meta=None):
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            if file_size > 0 and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(fd, 0, file_size)
+                except OSError:
+                    pass
+            written = self._read_file_data(blocks_start, file_size, block_sizes,
+                                           frag_idx, frag_off, out_fd=fd)
+            if meta is not None:
+                mode_bits, uid_idx, gid_idx, xattr_idx = meta
+                self._apply_mode_uidgid_xattr(fd, mode_bits, uid_idx, gid_idx, xattr_idx)
+            return written
+        finally:
+            os.close(fd)
+
+    def extract_all(self, outdir, jobs=1):
         os.makedirs(outdir, exist_ok=True)
-        self._extract_node(self.root_inode_ref, outdir, "", depth=0)
-
-    def _extract_node(self, inode_ref, outdir, name, depth):
+        image_path = getattr(self.f, "name", None)
+        parallel = jobs is not None and jobs > 1 and isinstance(image_path, str)
+        # 병렬 모드: 트리 순회 중 파일은 기록만 모으고, 본문 추출은 워커에 위임
+        self._file_records = [] if parallel else None
+
+        # 재귀 대신 명시적 work queue: 깊은 트리에서 스택 한도(기본 1000) 회피
+        queue = collections.deque([(self.root_inode_ref, outdir, "", 0)])
+        while queue:
+            inode_ref, od, name, depth = queue.pop()
+            self._extract_node(inode_ref, od, name, depth, queue)
+
+        if not parallel:
+            return
+        records = self._file_records
+        self._file_records = None
+        records.sort(key=lambda r: r[0])  # blocks_start 순 → 디스크 접근 대략 순차화
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_extract_worker,
+                initargs=(image_path, self._meta_cache_cap, self.apply_meta)) as pool:
+            for written, frag_used in pool.map(_extract_file_worker, records, chunksize=16):
+                self.stats["total_bytes"] += written
+                if written > 0:
+                    self.stats["files_nonempty"] += 1
+                if frag_used is not None:
+                    self.stats["fragments_used"].add(frag_used)
+
+    def _extract_node(self, inode_ref, outdir, name, depth, queue):
         # 최대 디렉터리 깊이 갱신
         self.stats["max_depth"] = max(self.stats["max_depth"], depth)
 
         block, typ, hdr, cur = self._inode_by_ref(inode_ref)
 
+        # 노드의 출력 경로는 한 번만 계산 (루트는 outdir 자신)
+        here = outdir if name == "" else _safe_join(outdir, name)
+
         if typ in (1, 8):  # directory
             self.stats["dirs"] += 1
 
             if typ == 1:  # basic dir
-                dir_block_start = u32(block, cur + 0)
-                file_size = u16(block, cur + 8)
-                block_offset = u16(block, cur + 10)
+                dir_block_start, _nlink, file_size, block_offset, _parent = \
+                    _DIR_BASIC.unpack_from(block, cur)
                 xattr_idx = None
                 cur += 16
                 total = max(0, file_size - 3)  # . / .. / self 보정
             else:          # dir v2
-                file_size = u32(block, cur + 4)
-                dir_block_start = u32(block, cur + 8)
-                block_offset = u16(block, cur + 18)
-                xattr_idx = u32(block, cur + 20)
+                (_nlink, file_size, dir_block_start, _parent,
+                 _i_count, block_offset, xattr_idx) = _DIR_EXT.unpack_from(block, cur)
                 cur += 24
                 total = file_size
 
-            here = outdir if name == "" else _safe_join(outdir, name)
             os.makedirs(here, exist_ok=True)
             self._apply_mode_uidgid_xattr(here, hdr["mode"], hdr["uid_idx"], hdr["gid_idx"], xattr_idx)
 
             ents = self._read_dir_entries(dir_block_start, block_offset, total)
-            for e in ents:
-                self._extract_node(e["inode_ref"], _safe_join(outdir, name) if name else outdir, e["name"], depth=depth+1)
+            # pop()이 뒤에서 꺼내므로 역순으로 push해서 리스팅 순서 유지
+            for i in range(len(ents.names) - 1, -1, -1):
+                queue.append((ents.refs[i], here, ents.names[i], depth + 1))
 
         elif typ in (2, 9):  # regular file
             self.stats["files"] += 1
 
-            if typ == 2:  # basic file
-                blocks_start = u32(block, cur + 0)
-                frag_idx = u32(block, cur + 4)
-                frag_off = u32(block, cur + 8)
-                file_size = u32(block, cur + 12)
-                cur += 16
-                full_blocks = file_size // self.block_size
-                has_tail = (file_size % self.block_size) != 0
-                count = full_blocks if (has_tail and frag_idx != 0xFFFFFFFF) else (
-                    int(ceil(file_size / float(self.block_size))) if file_size else 0
-                )
-                block_sizes = [u32(block, cur + 4*i) for i in range(count)]
-                xattr_idx = None
-            else:          # file v2
-                blocks_start = u64(block, cur + 0)
-                file_size = u64(block, cur + 8)
-                frag_idx = u32(block, cur + 28)
-                frag_off = u32(block, cur + 32)
-                xattr_idx = u32(block, cur + 36)
-                cur += 40
-                count = (file_size // self.block_size) if frag_idx != 0xFFFFFFFF else (
-                    int(ceil(file_size / float(self.block_size))) if file_size else 0
-                )
-                block_sizes = [u32(block, cur + 4*i) for i in range(count)]
-
-            data = self._read_file_data(blocks_start, file_size, block_sizes, frag_idx, frag_off)
-
-            path = _safe_join(outdir if name == "" else _safe_join(outdir, ""), name)
+            parse = self._parse_file_basic if typ == 2 else self._parse_file_ext
+            blocks_start, frag_idx, frag_off, file_size, xattr_idx, block_sizes = \
+                parse(block, cur)
+
+            path = here
             os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, "wb") as wf:
-                wf.write(data)
+
+            if self._file_records is not None:
+                # 병렬 추출: 본문/메타 적용은 워커가 수행 (통계도 워커 결과로 집계)
+                self._file_records.append((
+                    int(blocks_start), int(file_size),
+                    tuple(int(s) for s in block_sizes),
+                    int(frag_idx), int(frag_off),
+                    hdr["mode"], hdr["uid_idx"], hdr["gid_idx"], xattr_idx, path))
+                return
+
+            size_written = self._write_file(path, blocks_start, file_size, block_sizes,
+                                            frag_idx, frag_off,
+                                            meta=(hdr["mode"], hdr["uid_idx"], hdr["gid_idx"], xattr_idx))
 
             # 통계 업데이트
-            size_written = len(data)
             self.stats["total_bytes"] += size_written
             if size_written > 0:
                 self.stats["files_nonempty"] += 1
-            if (file_size % self.block_size) != 0 and frag_idx != 0xFFFFFFFF:
+            if frag_idx != 0xFFFFFFFF and self._has_tail(file_size):
                 self.stats["fragments_used"].add(frag_idx)
 
-            self._apply_mode_uidgid_xattr(path, hdr["mode"], hdr["uid_idx"], hdr["gid_idx"], xattr_idx)
-
         elif typ in (3, 10):  # symlink
             self.stats["symlinks"] += 1
-            tsize = u32(block, cur + 4)
+            _nlink, tsize = _SYMLINK_HDR.unpack_from(block, cur)
             target = block[cur + 8: cur + 8 + tsize].decode('utf-8', errors='surrogateescape')
-            path = _safe_join(outdir if name == "" else _safe_join(outdir, ""), name)
+            path = here
             try:
                 if os.path.lexists(path):
                     os.remove(path)
@@ -618,7 +1006,7 @@ class SquashFS:
         else:
             # device/fifo/socket 등
             self.stats["other"] += 1
-            path = _safe_join(outdir if name == "" else _safe_join(outdir, ""), name)
+            path = here
             os.makedirs(os.path.dirname(path), exist_ok=True)
             with open(path + ".unsupported", "w", encoding="utf-8") as wf:
                 wf.write(f"Unsupported inode type {typ}\n")
@@ -645,20 +1033,42 @@ class SquashFS:
         print(f"- Max directory depth   : {self.stats['max_depth']}")
         print("====================================\n")
 
+# ---- 병렬 추출 워커 (프로세스별로 이미지를 다시 열어 독립적으로 해제) ----
+_worker_fs = None
+
+def _init_extract_worker(image_path, meta_cache_blocks, apply_meta):
+    global _worker_fs
+    f = open(image_path, "rb")
+    _worker_fs = SquashFS(f, meta_cache_blocks=meta_cache_blocks)
+    _worker_fs.apply_meta = apply_meta
+
+def _extract_file_worker(record):
+    (blocks_start, file_size, block_sizes, frag_idx, frag_off,
+     mode, uid_idx, gid_idx, xattr_idx, path) = record
+    fs = _worker_fs
+    written = fs._write_file(path, blocks_start, file_size, block_sizes, frag_idx, frag_off,
+                             meta=(mode, uid_idx, gid_idx, xattr_idx))
+    frag_used = frag_idx if (frag_idx != 0xFFFFFFFF and fs._has_tail(file_size)) else None
+    return written, frag_used
+
 def main():
     ap = argparse.ArgumentParser(description="SquashFS v4 extractor (UID/GID + xattr, multi-compressor)")
     ap.add_argument("image", help="SquashFS.img path")
     ap.add_argument("-o", "--out", default="squashfs_out", help="Output directory")
     ap.add_argument("--no-meta", action="store_true", help="Do not apply chmod/chown/xattr on extract")
+    ap.add_argument("--meta-cache-blocks", type=int, default=256,
+                    help="Max decompressed metadata blocks kept in the LRU cache (default: 256)")
+    ap.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes for file extraction (default: CPU count, 1 = serial)")
     args = ap.parse_args()
 
     with open(args.image, "rb") as f:
-        fs = SquashFS(f)
+        fs = SquashFS(f, meta_cache_blocks=args.meta_cache_blocks)
         if args.no_meta:
             fs.apply_meta = False
         comp_name = {1:"gzip",2:"lzma",3:"lzo",4:"xz",5:"lz4",6:"zstd"}.get(fs.compression_id, "unknown")
         print(f"[+] SquashFS v{fs.version_major}.{fs.version_minor} block_size={fs.block_size} comp_id={fs.compression_id}({comp_name})")
-        fs.extract_all(args.out)
+        fs.extract_all(args.out, jobs=args.jobs)
         print(f"[+] Extracted to {args.out}")
         fs.print_summary(args.out)
 